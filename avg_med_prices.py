@@ -1,10 +1,21 @@
 """Used Car Sales Technical Assessment"""
 
-from typing import Any
-import pandas as pd
+from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING, Any
+import light_reports
+import partitions
 
-# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, import-outside-toplevel
+
+
+# Zip code prefixes kept by filter_by_zipcode, also used to prune zip_prefix partitions
+ZIPCODE_PREFIXES = ("00", "19")
 
 
 # Import csv file with pandas
@@ -13,13 +24,13 @@ def import_csv(csv_path: str) -> pd.DataFrame:
     Import csv file into a pandas dataframe and make it globally available
 
     Args:
-    csv_path (str): The path to the csv file
+    csv_path (str): The path to the csv file, partitioned directory or glob
 
     Returns:
     pd.DataFrame: The dataframe containing the csv data
     """
-    # Return the dataframe
-    return pd.read_csv(csv_path)
+    # Return the dataframe of every csv file the path covers
+    return partitions.read_partitions(partitions.select_files(csv_path))
 
 
 # Add 0 to the beginning of the zip code until it is 5 characters long
@@ -59,7 +70,7 @@ def filter_by_zipcode(unfiltered_df: pd.DataFrame) -> pd.DataFrame:
     # convert zipcode to string
     filtered_df["zipcode"] = filtered_df["zipcode"].astype(str)
     # filter by zip code on first 2 digits
-    filtered_df = filtered_df[filtered_df["zipcode"].str[:2].between("00", "19")]
+    filtered_df = filtered_df[filtered_df["zipcode"].str[:2].between(*ZIPCODE_PREFIXES)]
     # sort the dataframe by zip code in ascending order
     filtered_df = filtered_df.sort_values(by="zipcode")
     # return the filtered dataframe
@@ -122,9 +133,61 @@ def print_results(analysis_results: dict[str, list[Any]]) -> None:
     print("=" * 60)
 
 
-if __name__ == "__main__":
-    df = import_csv("car_sales_dataset.csv")
-    zipped_zero_df = add_zero_to_zipcode(df)
+# Run the price difference analysis on the clean rows
+def _light_price_differences(rows: list[light_reports.Row]) -> None:
+    """
+    Run the price difference analysis on the stdlib path
+
+    Args:
+        rows (list[light_reports.Row]): The clean rows inside the purchase month window
+    """
+    print_results(light_reports.calculate_price_differences(rows))
+
+
+# Run the price difference analysis on the clean dataframe
+def _pandas_price_differences(clean_df: pd.DataFrame) -> None:
+    """
+    Run the price difference analysis on the pandas path
+
+    Args:
+        clean_df (pd.DataFrame): The clean rows inside the purchase month window
+    """
+    zipped_zero_df = add_zero_to_zipcode(clean_df)
     zipcode_df = filter_by_zipcode(zipped_zero_df)
     results = calculate_price_differences(zipcode_df)
     print_results(results)
+
+
+# Run the report on the fastest path for the file size
+def run_report(
+    csv_path: str,
+    light: bool | None = None,
+    purchase_months: tuple[str, str] | None = None,
+) -> None:
+    """
+    Run the price difference analysis, using the stdlib path for small inputs and pandas otherwise.
+    Partitions that cannot match the report filters are skipped without being opened.
+
+    Args:
+        csv_path (str): The path to the csv file, partitioned directory or glob
+        light (bool | None): Force the stdlib path (True) or the pandas path (False).
+            Chosen by the size of the files to read when None.
+        purchase_months (tuple[str, str] | None): The inclusive purchase month window,
+            e.g. ("2020-01", "2020-06"). All months when None.
+    """
+    light_reports.run_report(
+        csv_path,
+        _light_price_differences,
+        _pandas_price_differences,
+        light,
+        purchase_months,
+        zip_prefixes=ZIPCODE_PREFIXES,
+    )
+
+
+if __name__ == "__main__":
+    # Usage: python avg_med_prices.py [csv file, directory or glob] [first month] [last month]
+    run_report(
+        sys.argv[1] if len(sys.argv) > 1 else "car_sales_dataset.csv",
+        purchase_months=(sys.argv[2], sys.argv[3]) if len(sys.argv) > 3 else None,
+    )
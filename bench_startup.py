@@ -0,0 +1,117 @@
+"""Used Car Sales Technical Assessment"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines
+
+
+# Report modules measured by the benchmark
+REPORTS = ("avg_med_prices", "porsche_sales", "top_10_sales_ratio")
+
+# Number of cold starts measured for each case
+REPEATS = 5
+
+# Project root, added to the child interpreter's path
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+# Write a small csv file shaped like the real dataset
+def write_sample_csv(csv_path: str, rows: int = 200) -> None:
+    """
+    Write a small csv file with the columns used by the reports
+
+    Args:
+        csv_path (str): The path of the csv file to write
+        rows (int): The number of data rows
+    """
+    makes = ("Porsche", "BMW", "Toyota", "Ford")
+    with open(csv_path, "w", encoding="utf-8") as csv_file:
+        csv_file.write(
+            "Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car\n"
+        )
+        for i in range(rows):
+            csv_file.write(
+                f"{makes[i % 4]},{20000 + i * 137},{19000 + i * 151},{110 + i % 90},"
+                f"{(i * 997) % 100000:05d},{1 + i % 12:02d}/{1 + i % 28:02d}/2020,0.1,{i % 3 == 0}\n"
+            )
+
+
+# Time a cold interpreter running a snippet
+def time_cold_start(code: str, cwd: str) -> float:
+    """
+    Run the code in a fresh interpreter and return the median wall time
+
+    Args:
+        code (str): The python code to run
+        cwd (str): The working directory of the child interpreter
+
+    Returns:
+        float: The median wall time in milliseconds
+    """
+    env = {**os.environ, "PYTHONPATH": ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=cwd,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+# Measure the cold-start latency of every report on both paths
+def run_benchmark() -> dict[str, list[float]]:
+    """
+    Measure the cold-start latency of each report on the stdlib and pandas paths
+
+    Returns:
+        dict[str, list[float]]: The import, stdlib path and pandas path timings of each report
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "sample.csv")
+        write_sample_csv(csv_path)
+        for report in REPORTS:
+            results[report] = [
+                time_cold_start(f"import {report}", temp_dir),
+                time_cold_start(
+                    f"import {report}; {report}.run_report({csv_path!r}, light=True)",
+                    temp_dir,
+                ),
+                time_cold_start(
+                    f"import {report}; {report}.run_report({csv_path!r}, light=False)",
+                    temp_dir,
+                ),
+            ]
+    return results
+
+
+# Print the benchmark results
+def print_results(results: dict[str, list[float]]) -> None:
+    """
+    Print the cold-start latency of each report
+
+    Args:
+        results (dict[str, list[float]]): The benchmark timings
+    """
+    print("\n" + "=" * 70)
+    print("               Cold-Start Latency (median ms)               ")
+    print("=" * 70)
+    print(f"{'Report':<25}{'Import':>15}{'Stdlib Path':>15}{'Pandas Path':>15}")
+    print("=" * 70)
+    for report, (import_ms, light_ms, pandas_ms) in results.items():
+        print(f"{report:<25}{import_ms:>15.1f}{light_ms:>15.1f}{pandas_ms:>15.1f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    print_results(run_benchmark())
@@ -0,0 +1,311 @@
+"""Used Car Sales Technical Assessment"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, import-outside-toplevel
+
+
+# Bit flags for each data-quality rule, combined per row into the quality mask
+TOP_SPEED_INVALID = 1
+SALE_PRICE_MISSING = 2
+RESELL_PRICE_MISSING = 4
+ZIPCODE_MALFORMED = 8
+PURCHASE_DATE_INVALID = 16
+
+# Reason codes written to the quarantine file, in bit order
+REASON_CODES: dict[int, str] = {
+    TOP_SPEED_INVALID: "TOP_SPEED_INVALID",
+    SALE_PRICE_MISSING: "SALE_PRICE_MISSING",
+    RESELL_PRICE_MISSING: "RESELL_PRICE_MISSING",
+    ZIPCODE_MALFORMED: "ZIPCODE_MALFORMED",
+    PURCHASE_DATE_INVALID: "PURCHASE_DATE_INVALID",
+}
+
+MASK_COLUMN = "quality_mask"
+REASON_COLUMN = "quality_reasons"
+
+# Date formats accepted for the purchase date, tried in order by both execution paths
+DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d")
+
+# Zip codes that can be zero padded to 5 digits, allowing the ".0" of a zip code read as a float
+ZIPCODE_PATTERN = r"\d{1,5}(\.0*)?"
+
+# Trailing ".0" removed from a valid zip code before zero padding
+ZIPCODE_FRACTION = r"\.0*$"
+
+# Numeric columns converted from text once their rules pass
+NUMERIC_COLUMNS = ("Top Speed", "Sale Price", "Resell Price")
+
+
+# Parse purchase dates with the accepted date formats
+def parse_purchase_dates(purchase_dates: pd.Series) -> pd.Series:
+    """
+    Parse purchase dates by trying each of the DATE_FORMATS in order, so rows with
+    different formats parse the same way regardless of the first row. Surrounding
+    whitespace is ignored, matching light_reports.parse_date.
+
+    Args:
+        purchase_dates (pd.Series): The purchase date column as read from the csv
+
+    Returns:
+        pd.Series: The parsed dates, NaT when no format matches
+    """
+    import pandas as pd
+
+    # Ignore surrounding whitespace
+    purchase_dates = purchase_dates.astype("string").str.strip()
+    # Keep the first format that parses each date
+    parsed = pd.to_datetime(purchase_dates, format=DATE_FORMATS[0], errors="coerce")
+    for date_format in DATE_FORMATS[1:]:
+        parsed = parsed.fillna(
+            pd.to_datetime(purchase_dates, format=date_format, errors="coerce")
+        )
+    # Return the parsed dates
+    return parsed
+
+
+# Flag zip codes that cannot be padded into a 5 digit zip code
+def _malformed_zipcodes(zipcodes: pd.Series) -> pd.Series:
+    """
+    Flag zip codes that are missing or cannot be zero padded to 5 digits
+
+    Args:
+        zipcodes (pd.Series): The zipcode column as read from the csv
+
+    Returns:
+        pd.Series: True where the zip code is malformed
+    """
+    import pandas as pd
+
+    # Numeric zip codes must be whole numbers that fit in 5 digits
+    if pd.api.types.is_numeric_dtype(zipcodes):
+        return ~(zipcodes.between(0, 99999) & (zipcodes % 1 == 0))
+    # String zip codes must be 1 to 5 digits before zero padding
+    return (
+        ~zipcodes.astype("string")
+        .str.strip()
+        .str.fullmatch(ZIPCODE_PATTERN)
+        .fillna(False)
+        .astype(bool)
+    )
+
+
+# Zero pad valid zip codes into 5 digit strings
+def _normalize_zipcodes(zipcodes: pd.Series) -> pd.Series:
+    """
+    Convert zip codes that passed ZIPCODE_MALFORMED into zero padded 5 digit strings.
+    A blank zip code in a quarantined row leaves the column as float64, which would
+    otherwise turn 1234 into "1234.0" downstream.
+
+    Args:
+        zipcodes (pd.Series): The valid zip codes of the clean rows
+
+    Returns:
+        pd.Series: The zip codes as zero padded 5 digit strings
+    """
+    import pandas as pd
+
+    # Numeric zip codes are whole numbers once malformed rows are removed
+    if pd.api.types.is_numeric_dtype(zipcodes):
+        zipcodes = zipcodes.astype("int64")
+    # Return the zero padded zip codes
+    return (
+        zipcodes.astype(str)
+        .str.strip()
+        .str.replace(ZIPCODE_FRACTION, "", regex=True)
+        .str.zfill(5)
+    )
+
+
+# Convert a numeric column, treating values that are not finite numbers as missing
+def _finite_numbers(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to numbers, with non-numeric, nan and infinite values as NaN.
+    read_csv parses "inf" and "Infinity" as floats, which would otherwise pass as prices.
+
+    Args:
+        values (pd.Series): The column as read from the csv
+
+    Returns:
+        pd.Series: The finite numbers, NaN everywhere else
+    """
+    import pandas as pd
+
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.where(numbers.abs() != math.inf)
+
+
+# Evaluate every rule in one vectorized pass and build the per-row bitmask
+def build_quality_mask(raw_df: pd.DataFrame) -> pd.Series:
+    """
+    Evaluate every data-quality rule against the dataframe and combine the
+    failures into a per-row bitmask. Rules whose column is not present are skipped.
+
+    Args:
+        raw_df (pd.DataFrame): The dataframe containing the csv data
+
+    Returns:
+        pd.Series: The bitmask of failed rules for each row, 0 when the row is clean
+    """
+    import pandas as pd
+
+    # Collect the failure condition for each rule
+    failures: dict[int, pd.Series] = {}
+    if "Top Speed" in raw_df.columns:
+        top_speed = _finite_numbers(raw_df["Top Speed"])
+        failures[TOP_SPEED_INVALID] = ~(top_speed > 0)
+    if "Sale Price" in raw_df.columns:
+        failures[SALE_PRICE_MISSING] = _finite_numbers(raw_df["Sale Price"]).isna()
+    if "Resell Price" in raw_df.columns:
+        failures[RESELL_PRICE_MISSING] = _finite_numbers(raw_df["Resell Price"]).isna()
+    if "zipcode" in raw_df.columns:
+        failures[ZIPCODE_MALFORMED] = _malformed_zipcodes(raw_df["zipcode"])
+    if "MM/DD/YY Purchase Date" in raw_df.columns:
+        failures[PURCHASE_DATE_INVALID] = parse_purchase_dates(
+            raw_df["MM/DD/YY Purchase Date"]
+        ).isna()
+
+    # Combine the failures into a single bitmask
+    mask = pd.Series(0, index=raw_df.index, dtype="uint8")
+    for bit, failed in failures.items():
+        mask |= failed.astype("uint8") * bit
+    # Return the bitmask
+    return mask
+
+
+# Translate a bitmask into its reason codes
+def describe_mask(mask: pd.Series) -> pd.Series:
+    """
+    Translate a quality bitmask into pipe separated reason codes
+
+    Args:
+        mask (pd.Series): The bitmask of failed rules
+
+    Returns:
+        pd.Series: The reason codes for each row, empty when the row is clean
+    """
+    import pandas as pd
+
+    # Start with no reasons and append the code of every failed rule
+    reasons = pd.Series("", index=mask.index, dtype="string")
+    for bit, code in REASON_CODES.items():
+        reasons = reasons.str.cat(
+            (mask & bit)
+            .astype(bool)
+            .map({True: code + "|", False: ""})
+            .astype("string")
+        )
+    # Return the reasons without the trailing separator
+    return reasons.str.rstrip("|")
+
+
+# Split the dataframe into clean rows and quarantined rows
+def split_quarantine(raw_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split the dataframe into rows that pass every rule and rows that fail at least one
+
+    Args:
+        raw_df (pd.DataFrame): The dataframe containing the csv data
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The clean dataframe and the quarantined
+        dataframe with its quality mask and reason codes
+    """
+    import pandas as pd
+
+    # Build the bitmask once for all rules
+    mask = build_quality_mask(raw_df)
+    failed = mask != 0
+
+    # Clean rows keep the original columns, with zip codes as 5 digit strings
+    # and numeric columns read as text converted to numbers
+    clean_df = raw_df[~failed].copy()
+    if "zipcode" in clean_df.columns:
+        clean_df["zipcode"] = _normalize_zipcodes(clean_df["zipcode"])
+    for column in NUMERIC_COLUMNS:
+        if column in clean_df.columns:
+            clean_df[column] = pd.to_numeric(clean_df[column])
+
+    # Quarantined rows carry the bitmask and reason codes
+    quarantine_df = raw_df[failed].copy()
+    quarantine_df[MASK_COLUMN] = mask[failed]
+    quarantine_df[REASON_COLUMN] = describe_mask(mask[failed])
+
+    # Return both dataframes
+    return clean_df, quarantine_df
+
+
+# Count the failures of each rule
+def summarize_quarantine(
+    clean_df: pd.DataFrame, quarantine_df: pd.DataFrame
+) -> dict[str, int]:
+    """
+    Summarize the row counts and the number of failures for each rule
+
+    Args:
+        clean_df (pd.DataFrame): The clean dataframe
+        quarantine_df (pd.DataFrame): The quarantined dataframe
+
+    Returns:
+        dict[str, int]: The row counts followed by the failure count of each rule
+    """
+    import pandas as pd
+
+    # Count the rows on each side of the split
+    summary = {
+        "Total Rows": len(clean_df) + len(quarantine_df),
+        "Clean Rows": len(clean_df),
+        "Quarantined Rows": len(quarantine_df),
+    }
+    # Count the failures of each rule
+    mask = quarantine_df.get(MASK_COLUMN, pd.Series(dtype="uint8"))
+    for bit, code in REASON_CODES.items():
+        summary[code] = int((mask & bit).astype(bool).sum())
+    # Return the summary
+    return summary
+
+
+# Print the data quality summary
+def print_summary(summary: dict[str, int]) -> None:
+    """
+    Print the data quality summary
+
+    Args:
+        summary (dict[str, int]): The data quality summary
+    """
+    # Print the results
+    print("\n" + "=" * 60)
+    print("                   Data Quality Summary                   ")
+    print("=" * 60)
+    for label, count in summary.items():
+        print(f"{label + ':':<30}{count:>10}")
+    print("=" * 60)
+
+
+# Run the validation stage ahead of a report
+def run_quality_stage(
+    raw_df: pd.DataFrame, quarantine_path: str = "quarantine.csv"
+) -> pd.DataFrame:
+    """
+    Validate the dataframe, write failed rows to the quarantine file and print
+    the summary counts so the reports only ever see clean data
+
+    Args:
+        raw_df (pd.DataFrame): The dataframe containing the csv data
+        quarantine_path (str): The path of the quarantine csv file
+
+    Returns:
+        pd.DataFrame: The clean dataframe
+    """
+    # Split, write the quarantine file and report the counts
+    clean_df, quarantine_df = split_quarantine(raw_df)
+    quarantine_df.to_csv(quarantine_path, index=False)
+    print_summary(summarize_quarantine(clean_df, quarantine_df))
+    # Return the clean dataframe
+    return clean_df
@@ -0,0 +1,470 @@
+"""Used Car Sales Technical Assessment"""
+
+from __future__ import annotations
+
+import csv
+import math
+import os
+import re
+import statistics
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Callable
+import partitions
+from data_quality import (
+    DATE_FORMATS,
+    MASK_COLUMN,
+    PURCHASE_DATE_INVALID,
+    REASON_CODES,
+    REASON_COLUMN,
+    RESELL_PRICE_MISSING,
+    SALE_PRICE_MISSING,
+    TOP_SPEED_INVALID,
+    ZIPCODE_FRACTION,
+    ZIPCODE_MALFORMED,
+    ZIPCODE_PATTERN,
+    print_summary,
+    run_quality_stage as run_pandas_quality_stage,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines
+
+
+# Files below this size skip pandas and run on the stdlib path
+SMALL_FILE_BYTES = 1_000_000
+
+# Cell values pandas reads as missing
+NA_VALUES = {
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+}
+
+Row = dict[str, str]
+
+
+# Decide which execution path to use for the csv files
+def is_small_input(csv_paths: list[str]) -> bool:
+    """
+    Check whether the csv files are small enough for the stdlib path
+
+    Args:
+        csv_paths (list[str]): The csv files to read
+
+    Returns:
+        bool: True when the files add up to less than SMALL_FILE_BYTES
+    """
+    return sum(os.path.getsize(csv_path) for csv_path in csv_paths) < SMALL_FILE_BYTES
+
+
+# Import csv file with the stdlib csv module
+def read_rows(csv_path: str) -> list[Row]:
+    """
+    Import csv file into a list of rows keyed by column name
+
+    Args:
+        csv_path (str): The path to the csv file
+
+    Returns:
+        list[Row]: The rows of the csv file
+    """
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        return list(csv.DictReader(csv_file))
+
+
+# Import the selected csv files with the stdlib csv module
+def read_partitions(csv_paths: list[str]) -> list[Row]:
+    """
+    Import the csv files into a single list of rows, matching partitions.read_partitions
+
+    Args:
+        csv_paths (list[str]): The csv files
+
+    Returns:
+        list[Row]: The rows of every file, in daily file order
+
+    Raises:
+        ValueError: If there are no csv files to read
+    """
+    if not csv_paths:
+        raise ValueError("No csv files to read")
+    # Tag each row with its daily file, the part name of the partition file
+    tagged_rows = [
+        (os.path.basename(csv_path), row)
+        for csv_path in csv_paths
+        for row in read_rows(csv_path)
+    ]
+    # Restore the daily file order and drop the row numbers
+    if tagged_rows and partitions.SOURCE_ROW_COLUMN in tagged_rows[0][1]:
+        tagged_rows.sort(
+            key=lambda tagged: (
+                tagged[0],
+                int(tagged[1].get(partitions.SOURCE_ROW_COLUMN) or 0),
+            )
+        )
+        for _, row in tagged_rows:
+            row.pop(partitions.SOURCE_ROW_COLUMN, None)
+    return [row for _, row in tagged_rows]
+
+
+# Parse a number, returning None for missing or invalid values
+def parse_number(value: str) -> float | None:
+    """
+    Parse a csv cell into a float
+
+    Args:
+        value (str): The csv cell
+
+    Returns:
+        float | None: The parsed number, or None when missing, invalid or nan
+    """
+    if value.strip() in NA_VALUES:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    # Spellings such as NAN are not missing to read_csv but still parse to nan
+    return None if math.isnan(number) else number
+
+
+# Parse a number, returning None unless it is finite
+def _finite_number(value: str) -> float | None:
+    """
+    Parse a csv cell into a finite float, matching data_quality._finite_numbers
+
+    Args:
+        value (str): The csv cell
+
+    Returns:
+        float | None: The parsed number, or None when missing, invalid, nan or infinite
+    """
+    number = parse_number(value)
+    if number is None or not math.isfinite(number):
+        return None
+    return number
+
+
+# Parse a purchase date, returning None when it cannot be parsed
+def parse_date(value: str) -> date | None:
+    """
+    Parse a purchase date using the accepted date formats, matching
+    data_quality.parse_purchase_dates
+
+    Args:
+        value (str): The csv cell
+
+    Returns:
+        date | None: The parsed date, or None when it cannot be parsed
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+# Apply the data-quality rules to a single row
+def row_quality_mask(row: Row) -> int:
+    """
+    Evaluate the data-quality rules against a row. Rules whose column is not
+    present are skipped, matching data_quality.build_quality_mask.
+
+    Args:
+        row (Row): The csv row
+
+    Returns:
+        int: The bitmask of failed rules, 0 when the row is clean
+    """
+    mask = 0
+    if "Top Speed" in row:
+        top_speed = _finite_number(row["Top Speed"])
+        if top_speed is None or top_speed <= 0:
+            mask |= TOP_SPEED_INVALID
+    if "Sale Price" in row and _finite_number(row["Sale Price"]) is None:
+        mask |= SALE_PRICE_MISSING
+    if "Resell Price" in row and _finite_number(row["Resell Price"]) is None:
+        mask |= RESELL_PRICE_MISSING
+    if "zipcode" in row and not re.fullmatch(ZIPCODE_PATTERN, row["zipcode"].strip()):
+        mask |= ZIPCODE_MALFORMED
+    if (
+        "MM/DD/YY Purchase Date" in row
+        and parse_date(row["MM/DD/YY Purchase Date"]) is None
+    ):
+        mask |= PURCHASE_DATE_INVALID
+    return mask
+
+
+# Run the validation stage ahead of a report
+def run_quality_stage(
+    rows: list[Row], quarantine_path: str = "quarantine.csv"
+) -> list[Row]:
+    """
+    Validate the rows, write failed rows to the quarantine file and print the
+    summary counts, matching data_quality.run_quality_stage
+
+    Args:
+        rows (list[Row]): The csv rows
+        quarantine_path (str): The path of the quarantine csv file
+
+    Returns:
+        list[Row]: The clean rows
+    """
+    clean_rows: list[Row] = []
+    quarantine_rows: list[Row] = []
+    failures = dict.fromkeys(REASON_CODES.values(), 0)
+    for row in rows:
+        mask = row_quality_mask(row)
+        if not mask:
+            clean_rows.append(row)
+            continue
+        reasons = [code for bit, code in REASON_CODES.items() if mask & bit]
+        for code in reasons:
+            failures[code] += 1
+        quarantine_rows.append(
+            {**row, MASK_COLUMN: str(mask), REASON_COLUMN: "|".join(reasons)}
+        )
+
+    # Write the quarantine file with the same columns as the pandas path
+    fieldnames = list(rows[0]) if rows else []
+    with open(quarantine_path, "w", newline="", encoding="utf-8") as quarantine_file:
+        writer = csv.DictWriter(
+            quarantine_file, fieldnames=fieldnames + [MASK_COLUMN, REASON_COLUMN]
+        )
+        writer.writeheader()
+        writer.writerows(quarantine_rows)
+
+    print_summary(
+        {
+            "Total Rows": len(rows),
+            "Clean Rows": len(clean_rows),
+            "Quarantined Rows": len(quarantine_rows),
+            **failures,
+        }
+    )
+    return clean_rows
+
+
+# Keep rows inside the purchase month window
+def filter_by_purchase_month(
+    rows: list[Row], purchase_months: tuple[str, str]
+) -> list[Row]:
+    """
+    Filter the rows by purchase month, matching partitions.filter_by_purchase_month
+
+    Args:
+        rows (list[Row]): The clean csv rows
+        purchase_months (tuple[str, str]): The inclusive purchase month range, e.g. ("2020-01", "2020-06")
+
+    Returns:
+        list[Row]: The rows purchased inside the window
+    """
+    filtered = []
+    for row in rows:
+        purchase_date = parse_date(row["MM/DD/YY Purchase Date"])
+        if (
+            purchase_date
+            and purchase_months[0]
+            <= purchase_date.strftime("%Y-%m")
+            <= purchase_months[1]
+        ):
+            filtered.append(row)
+    return filtered
+
+
+# Calculate the price differences for zip codes 00 to 19
+def calculate_price_differences(rows: list[Row]) -> dict[str, list[Any]]:
+    """
+    Calculate the average and median price differences for zip codes whose
+    first two digits are between 00 and 19, matching avg_med_prices
+
+    Args:
+        rows (list[Row]): The clean csv rows
+
+    Returns:
+        dict[str, list[Any]]: The price change analysis data
+    """
+    differences = [
+        float(row["Resell Price"]) - float(row["Sale Price"])
+        for row in rows
+        if "00"
+        <= re.sub(ZIPCODE_FRACTION, "", row["zipcode"].strip()).zfill(5)[:2]
+        <= "19"
+    ]
+    # No matching rows gives nan, like the mean and median of an empty pandas column
+    if not differences:
+        differences = [math.nan]
+    absolute = [abs(difference) for difference in differences]
+    return {
+        "Average Price Change": [statistics.fmean(differences)],
+        "Median Price Change": [statistics.median(differences)],
+        "Average Absolute Price Change": [statistics.fmean(absolute)],
+        "Median Absolute Price Change": [statistics.median(absolute)],
+    }
+
+
+# Add years to a date the way pd.DateOffset does
+def add_years(start: date, years: int) -> date:
+    """
+    Add years to a date, moving 29 February to 28 February in non-leap years
+
+    Args:
+        start (date): The start date
+        years (int): The number of years to add
+
+    Returns:
+        date: The shifted date
+    """
+    try:
+        return start.replace(year=start.year + years)
+    except ValueError:
+        return start.replace(year=start.year + years, day=28)
+
+
+# Aggregate depreciation data for Porsche owners
+def aggregate_depreciation(rows: list[Row]) -> list[tuple[date, float]]:
+    """
+    Calculate the depreciated date and value after 3 years for Porsche owners,
+    matching porsche_sales
+
+    Args:
+        rows (list[Row]): The clean csv rows
+
+    Returns:
+        list[tuple[date, float]]: The depreciated date and value of each Porsche
+    """
+    results = []
+    for row in rows:
+        if row["Make"] != "Porsche":
+            continue
+        sale_price = float(row["Sale Price"])
+        # A missing rate carries nan into the value, which pandas prints as $nan
+        rate = parse_number(
+            row.get("Annual Depreciation Rate", row.get("Annual Deprecation Rate", ""))
+        )
+        if rate is None:
+            rate = math.nan
+        accrued = round(sale_price * (1 - rate) ** 3, 2)
+        purchase_date = parse_date(row["MM/DD/YY Purchase Date"])
+        if purchase_date is None:
+            raise ValueError(f"Invalid purchase date: {row['MM/DD/YY Purchase Date']}")
+        results.append((add_years(purchase_date, 3), round(sale_price - accrued, 2)))
+    return results
+
+
+# Rank used cars by sales price to top speed ratio
+def set_top_10(rows: list[Row]) -> list[tuple[float, float, float]]:
+    """
+    Rank the used cars by sales price to top speed ratio, matching top_10_sales_ratio
+
+    Args:
+        rows (list[Row]): The clean csv rows
+
+    Returns:
+        list[tuple[float, float, float]]: The sale price, top speed and ratio of each
+        used car in descending ratio order
+    """
+    ranked = []
+    for row in rows:
+        if row["is_new_car"].strip().lower() not in ("false", "0"):
+            continue
+        sale_price = float(row["Sale Price"])
+        top_speed = float(row["Top Speed"])
+        ranked.append((sale_price, top_speed, round(sale_price / top_speed, 3)))
+    # sorted is stable, so ties keep their file order like the stable sort_values
+    return sorted(ranked, key=lambda result: result[2], reverse=True)
+
+
+def print_depreciation(results: list[tuple[date, float]]) -> None:
+    """
+    Format and print the depreciation results, matching porsche_sales.print_results
+
+    Args:
+        results (list[tuple[date, float]]): The depreciated date and value of each Porsche
+    """
+    print("\nDepreciated Values after 3 Years:")
+    print("=" * 55)
+    print(f"{'Depreciated Date':<25} {'Depreciated Value':<25}")
+    print("=" * 55)
+    for depreciated_date, depreciated_value in results:
+        formatted_value = f"${depreciated_value:.2f}"
+        print(f"{depreciated_date.strftime('%Y-%m-%d'):<25} {formatted_value:<25}")
+
+
+def print_top_10(results: list[tuple[float, float, float]]) -> None:
+    """
+    Print the top 10 cars by price to speed ratio, matching top_10_sales_ratio.print_top_10
+
+    Args:
+        results (list[tuple[float, float, float]]): The ranked used cars
+    """
+    print("\nTop 10 Cars by Price to Speed Ratio:")
+    print("=" * 60)
+    print(f"{'Sale Price':<15}{'Top Speed':<15}{'Ratio':<15}")
+    for sale_price, top_speed, ratio in results[:10]:
+        print(f"{f'${sale_price:.2f}':<15}{top_speed:<15g}{ratio:<15.3f}")
+    print("=" * 60)
+
+
+# Run a report on the fastest path for the file size
+def run_report(  # pylint: disable=too-many-arguments
+    csv_path: str,
+    light_report: Callable[[list[Row]], None],
+    pandas_report: Callable[[pd.DataFrame], None],
+    light: bool | None = None,
+    purchase_months: tuple[str, str] | None = None,
+    *,
+    zip_prefixes: tuple[str, str] | None = None,
+) -> None:
+    """
+    Select the files, choose the execution path, run the quality stage and the purchase
+    month filter, then hand the rows to the report. Partitions that cannot match
+    the report filters are skipped without being opened.
+
+    Args:
+        csv_path (str): The path to the csv file, partitioned directory or glob
+        light_report (Callable[[list[Row]], None]): Prints the report on the stdlib
+            path from the clean rows
+        pandas_report (Callable[[pd.DataFrame], None]): Prints the report on the pandas
+            path from the clean dataframe
+        light (bool | None): Force the stdlib path (True) or the pandas path (False).
+            Chosen by the size of the files to read when None.
+        purchase_months (tuple[str, str] | None): The inclusive purchase month window,
+            e.g. ("2020-01", "2020-06"). All months when None.
+        zip_prefixes (tuple[str, str] | None): The inclusive zip prefix range the report
+            keeps, used to prune zip_prefix partitions
+    """
+    csv_paths = partitions.select_files(
+        csv_path, zip_prefixes=zip_prefixes, purchase_months=purchase_months
+    )
+    if light is None:
+        light = is_small_input(csv_paths)
+    if light:
+        rows = run_quality_stage(read_partitions(csv_paths))
+        if purchase_months:
+            rows = filter_by_purchase_month(rows, purchase_months)
+        light_report(rows)
+        return
+    df = run_pandas_quality_stage(partitions.read_partitions(csv_paths))
+    if purchase_months:
+        df = partitions.filter_by_purchase_month(df, purchase_months)
+    pandas_report(df)
@@ -0,0 +1,320 @@
+"""Used Car Sales Technical Assessment"""
+
+from __future__ import annotations
+
+import glob
+import os
+import sys
+from typing import TYPE_CHECKING
+from data_quality import ZIPCODE_FRACTION, ZIPCODE_PATTERN, parse_purchase_dates
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, import-outside-toplevel
+
+
+# Partition keys, stored as key=value directories: purchase_month=2020-01/zip_prefix=01/part.csv
+PURCHASE_MONTH_KEY = "purchase_month"
+ZIP_PREFIX_KEY = "zip_prefix"
+
+# Partition value for rows whose key cannot be derived; never pruned
+UNKNOWN_PARTITION = "unknown"
+
+# Row number within the daily file, used to restore the daily file order on read
+SOURCE_ROW_COLUMN = "source_row"
+
+
+# Resolve a csv file, partitioned directory or glob into csv files
+def resolve_files(source: str) -> list[str]:
+    """
+    Resolve a csv file, a partitioned directory or a glob into the csv files it covers
+
+    Args:
+        source (str): The csv file, directory or glob pattern
+
+    Returns:
+        list[str]: The csv files in sorted order
+
+    Raises:
+        FileNotFoundError: If the source does not match any csv file
+    """
+    # A single file is read as before
+    if os.path.isfile(source):
+        return [source]
+    # A directory covers every csv file below it
+    if os.path.isdir(source):
+        source = os.path.join(source, "**", "*.csv")
+    files = sorted(
+        path for path in glob.glob(source, recursive=True) if os.path.isfile(path)
+    )
+    if not files:
+        raise FileNotFoundError(f"No csv files found for {source}")
+    # Return the files
+    return files
+
+
+# Read the partition keys from a file path
+def partition_keys(csv_path: str) -> dict[str, str]:
+    """
+    Read the key=value partition directories from a file path
+
+    Args:
+        csv_path (str): The path to the csv file
+
+    Returns:
+        dict[str, str]: The partition keys and values, empty for unpartitioned files
+    """
+    parts = os.path.normpath(os.path.dirname(csv_path)).split(os.sep)
+    return dict(part.split("=", 1) for part in parts if "=" in part)
+
+
+# Check a partition value against an inclusive range
+def _may_match(value: str | None, bounds: tuple[str, str] | None) -> bool:
+    """
+    Check whether a partition can hold rows inside the range
+
+    Args:
+        value (str | None): The partition value, None when the file is not partitioned by the key
+        bounds (tuple[str, str] | None): The inclusive range, None for no filter
+
+    Returns:
+        bool: False only when the partition is known to be outside the range
+    """
+    if bounds is None or value is None or value == UNKNOWN_PARTITION:
+        return True
+    return bounds[0] <= value <= bounds[1]
+
+
+# Skip partitions that cannot match the report filters
+def prune_files(
+    csv_paths: list[str],
+    zip_prefixes: tuple[str, str] | None = None,
+    purchase_months: tuple[str, str] | None = None,
+) -> list[str]:
+    """
+    Drop the partitions that cannot hold rows inside the zip prefix or purchase month range.
+    Only the file paths are inspected, so pruned partitions are never opened.
+
+    Args:
+        csv_paths (list[str]): The csv files
+        zip_prefixes (tuple[str, str] | None): The inclusive zip prefix range, e.g. ("00", "19")
+        purchase_months (tuple[str, str] | None): The inclusive purchase month range, e.g. ("2020-01", "2020-06")
+
+    Returns:
+        list[str]: The csv files that may hold matching rows
+    """
+    kept = []
+    for csv_path in csv_paths:
+        keys = partition_keys(csv_path)
+        if _may_match(keys.get(ZIP_PREFIX_KEY), zip_prefixes) and _may_match(
+            keys.get(PURCHASE_MONTH_KEY), purchase_months
+        ):
+            kept.append(csv_path)
+    return kept
+
+
+# Resolve and prune a source in one step
+def select_files(
+    source: str,
+    zip_prefixes: tuple[str, str] | None = None,
+    purchase_months: tuple[str, str] | None = None,
+) -> list[str]:
+    """
+    Resolve a csv file, directory or glob and drop the partitions that cannot match
+
+    Args:
+        source (str): The csv file, directory or glob pattern
+        zip_prefixes (tuple[str, str] | None): The inclusive zip prefix range
+        purchase_months (tuple[str, str] | None): The inclusive purchase month range
+
+    Returns:
+        list[str]: The csv files to read
+
+    Raises:
+        ValueError: If every partition is pruned
+    """
+    csv_paths = prune_files(resolve_files(source), zip_prefixes, purchase_months)
+    if not csv_paths:
+        raise ValueError(
+            f"No partitions of {source} match zip_prefixes={zip_prefixes} and purchase_months={purchase_months}"
+        )
+    return csv_paths
+
+
+# Import the selected csv files with pandas
+def read_partitions(csv_paths: list[str]) -> pd.DataFrame:
+    """
+    Import the csv files into a single pandas dataframe. Rows written by write_partitions
+    are put back in daily file order (daily files by name, then rows as in the file),
+    so the result matches reading the concatenated daily files.
+
+    Args:
+        csv_paths (list[str]): The csv files
+
+    Returns:
+        pd.DataFrame: The dataframe containing the rows of every file
+
+    Raises:
+        ValueError: If there are no csv files to read
+    """
+    import pandas as pd
+
+    if not csv_paths:
+        raise ValueError("No csv files to read")
+    # Tag each row with its daily file, the part name of the partition file
+    frames = [
+        pd.read_csv(path).assign(_part_name=os.path.basename(path))
+        for path in csv_paths
+    ]
+    combined_df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    # Restore the daily file order
+    if SOURCE_ROW_COLUMN in combined_df.columns:
+        combined_df = combined_df.sort_values(
+            ["_part_name", SOURCE_ROW_COLUMN], kind="stable"
+        ).drop(columns=[SOURCE_ROW_COLUMN])
+    # Return the dataframe without the helper column
+    return combined_df.drop(columns=["_part_name"]).reset_index(drop=True)
+
+
+# Derive the partition keys of each row
+def _row_partition_keys(source_df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """
+    Derive the purchase month and zip prefix of each row
+
+    Args:
+        source_df (pd.DataFrame): The dataframe containing the csv data
+
+    Returns:
+        tuple[pd.Series, pd.Series]: The purchase month and zip prefix of each row
+    """
+    # Purchase month as YYYY-MM, unknown when the date cannot be parsed
+    purchase_dates = parse_purchase_dates(source_df["MM/DD/YY Purchase Date"])
+    months = purchase_dates.dt.strftime("%Y-%m").fillna(UNKNOWN_PARTITION)
+
+    # Zip prefix after zero padding, unknown when the zip code is malformed
+    zipcodes = _padded_zipcodes(source_df["zipcode"])
+    valid = zipcodes.str.fullmatch(r"\d{5}").fillna(False).astype(bool)
+    prefixes = zipcodes.str[:2].where(valid, UNKNOWN_PARTITION)
+
+    # Return the keys
+    return months.astype(str), prefixes.astype(str)
+
+
+# Zero pad the valid zip codes, keeping malformed ones as written
+def _padded_zipcodes(zipcodes: pd.Series) -> pd.Series:
+    """
+    Zero pad valid zip codes into 5 digit strings. A blank zip code makes pandas read
+    the column as float64, so 1234 is read as 1234.0 and is turned back into "01234".
+
+    Args:
+        zipcodes (pd.Series): The zipcode column as read from the csv
+
+    Returns:
+        pd.Series: The zero padded zip codes, malformed zip codes unchanged
+    """
+    text = zipcodes.astype("string").str.strip()
+    valid = text.str.fullmatch(ZIPCODE_PATTERN).fillna(False).astype(bool)
+    return (
+        text.str.replace(ZIPCODE_FRACTION, "", regex=True)
+        .str.zfill(5)
+        .where(valid, text)
+    )
+
+
+# Prepare a dataframe for writing so partitions read back like the daily file
+def _partition_output(source_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Write zip codes as zero padded strings, keep whole number columns as integers
+    even when a blank cell made pandas read them as float64, and record the row
+    number within the daily file
+
+    Args:
+        source_df (pd.DataFrame): The dataframe containing the csv data
+
+    Returns:
+        pd.DataFrame: The dataframe to write
+    """
+    import pandas as pd
+
+    output_df = source_df.copy()
+    output_df["zipcode"] = _padded_zipcodes(output_df["zipcode"])
+    for column in output_df.columns:
+        values = output_df[column]
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            output_df[column] = values.astype("Int64")
+    output_df[SOURCE_ROW_COLUMN] = range(len(output_df))
+    return output_df
+
+
+# Write a dataframe into the partitioned layout
+def write_partitions(source_df: pd.DataFrame, root: str, part_name: str) -> list[str]:
+    """
+    Write the rows into purchase_month=YYYY-MM/zip_prefix=NN/<part_name> files under root.
+    Use a distinct part_name per daily file so each day adds files to its partitions,
+    named so that they sort in the order the daily files should be concatenated.
+    Nothing is written when any of the files already exists, so a daily file that was
+    already added is never overwritten or half added again.
+
+    Args:
+        source_df (pd.DataFrame): The dataframe containing the csv data
+        root (str): The root directory of the partitioned dataset
+        part_name (str): The file name written inside each partition
+
+    Returns:
+        list[str]: The csv files written
+
+    Raises:
+        FileExistsError: If a partition already holds a file named part_name
+    """
+    months, prefixes = _row_partition_keys(source_df)
+    output_df = _partition_output(source_df)
+    groups = {
+        os.path.join(
+            root,
+            f"{PURCHASE_MONTH_KEY}={month}",
+            f"{ZIP_PREFIX_KEY}={prefix}",
+            part_name,
+        ): partition_df
+        for (month, prefix), partition_df in output_df.groupby(
+            [months, prefixes], sort=True
+        )
+    }
+    # Check every file before writing any of them
+    existing = [csv_path for csv_path in groups if os.path.exists(csv_path)]
+    if existing:
+        raise FileExistsError(f"Partition files already exist: {', '.join(existing)}")
+    for csv_path, partition_df in groups.items():
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        partition_df.to_csv(csv_path, index=False, mode="x")
+    return list(groups)
+
+
+# Keep rows inside the purchase month window
+def filter_by_purchase_month(
+    unfiltered_df: pd.DataFrame, purchase_months: tuple[str, str]
+) -> pd.DataFrame:
+    """
+    Filter car sales by purchase month, so the results match pruned partitions
+
+    Args:
+        unfiltered_df (pd.DataFrame): The dataframe containing the csv data
+        purchase_months (tuple[str, str]): The inclusive purchase month range, e.g. ("2020-01", "2020-06")
+
+    Returns:
+        pd.DataFrame: The filtered dataframe
+    """
+    months = parse_purchase_dates(unfiltered_df["MM/DD/YY Purchase Date"]).dt.strftime(
+        "%Y-%m"
+    )
+    return unfiltered_df[months.between(*purchase_months)]
+
+
+if __name__ == "__main__":
+    # Partition a daily file: python partitions.py <daily csv> <dataset root>
+    daily_path, dataset_root = sys.argv[1], sys.argv[2]
+    write_partitions(
+        read_partitions([daily_path]),
+        dataset_root,
+        part_name=os.path.basename(daily_path),
+    )
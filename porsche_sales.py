@@ -1,8 +1,17 @@
 """Used Car Sales Technical Assessment"""
 
-import pandas as pd
+from __future__ import annotations
 
-# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, missing-final-newline
+import sys
+from typing import TYPE_CHECKING
+import light_reports
+import partitions
+from data_quality import parse_purchase_dates
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, missing-final-newline, import-outside-toplevel
 
 
 # Import csv file with pandas
@@ -11,13 +20,13 @@ def import_csv(csv_path: str) -> pd.DataFrame:
     Import csv file into a pandas dataframe and make it globally available
 
     Args:
-    csv_path (str): The path to the csv file
+    csv_path (str): The path to the csv file, partitioned directory or glob
 
     Returns:
     pd.DataFrame: The dataframe containing the csv data
     """
-    # Return the dataframe
-    return pd.read_csv(csv_path)
+    # Return the dataframe of every csv file the path covers
+    return partitions.read_partitions(partitions.select_files(csv_path))
 
 
 # Filter the DataFrame to include only Porsche owners.
@@ -62,6 +71,8 @@ def aggregate_depreciation(dep_porsche_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The dataframe containing the aggregated depreciation data
     """
+    import pandas as pd
+
     # Rename depreciation rate column
     dep_porsche_df = dep_porsche_df.rename(
         columns={"Annual Deprecation Rate": "Annual Depreciation Rate"}
@@ -79,7 +90,7 @@ def aggregate_depreciation(dep_porsche_df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Convert 'MM/DD/YY Purchase Date' to datetime values from strings
-    dep_porsche_df["MM/DD/YY Purchase Date"] = pd.to_datetime(
+    dep_porsche_df["MM/DD/YY Purchase Date"] = parse_purchase_dates(
         dep_porsche_df["MM/DD/YY Purchase Date"]
     )
 
@@ -136,8 +147,55 @@ def print_results(new_df: pd.DataFrame) -> None:
         print(f"{formatted_date:<25} {formatted_value:<25}")
 
 
-if __name__ == "__main__":
-    df = import_csv("car_sales_dataset.csv")
-    porsche_df = filter_porsche(df)
+# Run the Porsche depreciation report on the clean rows
+def _light_depreciation(rows: list[light_reports.Row]) -> None:
+    """
+    Run the Porsche depreciation report on the stdlib path
+
+    Args:
+        rows (list[light_reports.Row]): The clean rows inside the purchase month window
+    """
+    light_reports.print_depreciation(light_reports.aggregate_depreciation(rows))
+
+
+# Run the Porsche depreciation report on the clean dataframe
+def _pandas_depreciation(clean_df: pd.DataFrame) -> None:
+    """
+    Run the Porsche depreciation report on the pandas path
+
+    Args:
+        clean_df (pd.DataFrame): The clean rows inside the purchase month window
+    """
+    porsche_df = filter_porsche(clean_df)
     agg_df = aggregate_depreciation(porsche_df)
     print_results(agg_df)
+
+
+# Run the report on the fastest path for the file size
+def run_report(
+    csv_path: str,
+    light: bool | None = None,
+    purchase_months: tuple[str, str] | None = None,
+) -> None:
+    """
+    Run the Porsche depreciation report, using the stdlib path for small inputs and pandas otherwise.
+    Partitions that cannot match the report filters are skipped without being opened.
+
+    Args:
+        csv_path (str): The path to the csv file, partitioned directory or glob
+        light (bool | None): Force the stdlib path (True) or the pandas path (False).
+            Chosen by the size of the files to read when None.
+        purchase_months (tuple[str, str] | None): The inclusive purchase month window,
+            e.g. ("2020-01", "2020-06"). All months when None.
+    """
+    light_reports.run_report(
+        csv_path, _light_depreciation, _pandas_depreciation, light, purchase_months
+    )
+
+
+if __name__ == "__main__":
+    # Usage: python porsche_sales.py [csv file, directory or glob] [first month] [last month]
+    run_report(
+        sys.argv[1] if len(sys.argv) > 1 else "car_sales_dataset.csv",
+        purchase_months=(sys.argv[2], sys.argv[3]) if len(sys.argv) > 3 else None,
+    )
@@ -0,0 +1,225 @@
+"""Used Car Sales Technical Assessment Tests"""
+
+import io
+import os
+import tempfile
+import pandas as pd
+import pytest
+from avg_med_prices import (
+    add_zero_to_zipcode,
+    calculate_price_differences,
+    filter_by_zipcode,
+)
+from data_quality import (
+    PURCHASE_DATE_INVALID,
+    RESELL_PRICE_MISSING,
+    SALE_PRICE_MISSING,
+    TOP_SPEED_INVALID,
+    ZIPCODE_MALFORMED,
+    build_quality_mask,
+    print_summary,
+    run_quality_stage,
+    split_quarantine,
+    summarize_quarantine,
+)
+
+# pylint: disable=line-too-long, missing-final-newline, line-too-long, redefined-outer-name
+
+
+@pytest.fixture
+def sample_data() -> pd.DataFrame:
+    """
+    Create a sample DataFrame with one clean row and one row per failed rule
+
+    Returns:
+        pd.DataFrame: Sample data dataframe
+    """
+    # Create a sample DataFrame
+    data = {
+        "Sale Price": [10000.0, 15000.0, None, 18000.0, 20000.0, 22000.0],
+        "Resell Price": [12000.0, 14000.0, 11000.0, None, 21000.0, 23000.0],
+        "Top Speed": [120.0, 0.0, 110.0, 140.0, 150.0, None],
+        "zipcode": ["01234", "12345", "2345", "abcde", "123456", "54321"],
+        "MM/DD/YY Purchase Date": [
+            "01/01/2020",
+            "02/15/2020",
+            "03/10/2020",
+            "04/20/2020",
+            "not a date",
+            "05/01/2020",
+        ],
+    }
+    # Return the DataFrame
+    return pd.DataFrame(data)
+
+
+def test_build_quality_mask(sample_data: pd.DataFrame) -> None:
+    """
+    Test the build_quality_mask function
+
+    Args:
+        sample_data (pd.DataFrame): Sample data dataframe
+    """
+    # Build the mask
+    mask = build_quality_mask(sample_data)
+    # Check the output
+    assert mask.tolist() == [
+        0,
+        TOP_SPEED_INVALID,
+        SALE_PRICE_MISSING,
+        RESELL_PRICE_MISSING | ZIPCODE_MALFORMED,
+        ZIPCODE_MALFORMED | PURCHASE_DATE_INVALID,
+        TOP_SPEED_INVALID,
+    ]
+
+
+def test_build_quality_mask_numeric_zipcode() -> None:
+    """
+    Test the build_quality_mask function with zip codes read as numbers
+    """
+    # Create a test dataframe
+    test_df = pd.DataFrame({"zipcode": [123, 12345, 123456, None, 12.5]})
+    # Build the mask
+    mask = build_quality_mask(test_df)
+    # Check the output
+    assert mask.tolist() == [0, 0] + [ZIPCODE_MALFORMED] * 3
+
+
+def test_build_quality_mask_infinite() -> None:
+    """
+    Test that infinite values read by read_csv fail the numeric rules
+    """
+    # Read a test csv with infinite values
+    test_df = pd.read_csv(
+        io.StringIO(
+            "Sale Price,Resell Price,Top Speed\ninf,100,150\n100,-inf,150\n100,200,Infinity\n100,200,150\n"
+        )
+    )
+    # Build the mask
+    mask = build_quality_mask(test_df)
+    # Check the output
+    assert mask.tolist() == [
+        SALE_PRICE_MISSING,
+        RESELL_PRICE_MISSING,
+        TOP_SPEED_INVALID,
+        0,
+    ]
+
+
+def test_split_quarantine(sample_data: pd.DataFrame) -> None:
+    """
+    Test the split_quarantine function
+
+    Args:
+        sample_data (pd.DataFrame): Sample data dataframe
+    """
+    # Split the data
+    clean_df, quarantine_df = split_quarantine(sample_data)
+    # Check the clean rows keep the original columns
+    assert clean_df.index.tolist() == [0]
+    assert list(clean_df.columns) == list(sample_data.columns)
+    # Check the quarantined rows and their reasons
+    assert quarantine_df.index.tolist() == [1, 2, 3, 4, 5]
+    assert quarantine_df["quality_reasons"].tolist() == [
+        "TOP_SPEED_INVALID",
+        "SALE_PRICE_MISSING",
+        "RESELL_PRICE_MISSING|ZIPCODE_MALFORMED",
+        "ZIPCODE_MALFORMED|PURCHASE_DATE_INVALID",
+        "TOP_SPEED_INVALID",
+    ]
+
+
+def test_split_quarantine_blank_zipcode() -> None:
+    """
+    Test that a quarantined blank zip code does not change the 00-19 zip code filter
+    """
+    # Read a csv file where the blank zip code makes the column float64
+    csv_data = (
+        "Sale Price,Resell Price,zipcode\n"
+        "100,1100,1234\n"
+        "200,700,15001\n"
+        "300,100,9999\n"
+        "400,900,20001\n"
+        "500,600,\n"
+        "600,700,55555\n"
+    )
+    raw_df = pd.read_csv(io.StringIO(csv_data))
+    # Run the price difference analysis on the clean rows
+    clean_df, _ = split_quarantine(raw_df)
+    zipcode_df = filter_by_zipcode(add_zero_to_zipcode(clean_df))
+    result = calculate_price_differences(zipcode_df)
+    # Check the output
+    assert zipcode_df["zipcode"].tolist() == ["01234", "09999", "15001"]
+    assert result["Average Price Change"][0] == pytest.approx(433.33, rel=1e-3)
+
+
+def test_split_quarantine_float_zipcode_text() -> None:
+    """
+    Test that a zip code written as a float is kept when the column is read as text
+    """
+    # Read a csv file where the malformed zip code makes the column text
+    raw_df = pd.read_csv(io.StringIO("zipcode\n1234.0\n15001\nabcde\n"))
+    # Split the rows
+    clean_df, quarantine_df = split_quarantine(raw_df)
+    # Check the output
+    assert clean_df["zipcode"].tolist() == ["01234", "15001"]
+    assert len(quarantine_df) == 1
+
+
+def test_summarize_quarantine(sample_data: pd.DataFrame) -> None:
+    """
+    Test the summarize_quarantine function
+
+    Args:
+        sample_data (pd.DataFrame): Sample data dataframe
+    """
+    # Summarize the split
+    summary = summarize_quarantine(*split_quarantine(sample_data))
+    # Check the output
+    assert summary == {
+        "Total Rows": 6,
+        "Clean Rows": 1,
+        "Quarantined Rows": 5,
+        "TOP_SPEED_INVALID": 2,
+        "SALE_PRICE_MISSING": 1,
+        "RESELL_PRICE_MISSING": 1,
+        "ZIPCODE_MALFORMED": 2,
+        "PURCHASE_DATE_INVALID": 1,
+    }
+
+
+def test_run_quality_stage(capsys, sample_data: pd.DataFrame) -> None:
+    """
+    Test the run_quality_stage function
+
+    Args:
+        capsys (): Pytest fixture that captures stdout and stderr
+        sample_data (pd.DataFrame): Sample data dataframe
+    """
+    # Run the stage with a temporary quarantine file
+    with tempfile.TemporaryDirectory() as temp_dir:
+        quarantine_path = os.path.join(temp_dir, "quarantine.csv")
+        clean_df = run_quality_stage(sample_data, quarantine_path)
+        quarantine_df = pd.read_csv(quarantine_path)
+    # Check the output
+    assert len(clean_df) == 1
+    assert len(quarantine_df) == 5
+    assert "quality_mask" in quarantine_df.columns
+    assert "Quarantined Rows:                      5" in capsys.readouterr().out
+
+
+def test_print_summary(capsys) -> None:
+    """
+    Test the print_summary function
+
+    Args:
+        capsys (): Pytest fixture that captures stdout and stderr
+    """
+    # Print the summary
+    print_summary({"Total Rows": 10, "TOP_SPEED_INVALID": 2})
+    # Capture the output
+    captured = capsys.readouterr()
+    # Check the output
+    assert "Data Quality Summary" in captured.out
+    assert "Total Rows:                           10" in captured.out
+    assert "TOP_SPEED_INVALID:                     2" in captured.out
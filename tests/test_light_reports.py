@@ -0,0 +1,274 @@
+"""Used Car Sales Technical Assessment Tests"""
+
+import math
+import os
+import subprocess
+import sys
+from datetime import date
+import pandas as pd
+import pytest
+import avg_med_prices
+import porsche_sales
+import top_10_sales_ratio
+from data_quality import build_quality_mask
+from light_reports import (
+    add_years,
+    aggregate_depreciation,
+    calculate_price_differences,
+    is_small_input,
+    read_rows,
+    row_quality_mask,
+    set_top_10,
+)
+
+# pylint: disable=line-too-long, missing-final-newline, line-too-long, redefined-outer-name
+
+SAMPLE_CSV = """Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car
+Porsche,50000,52000,180,1234,01/15/2020,0.1,False
+BMW,40000,35000,150,15001,02/29/2020,0.15,False
+Porsche,60000,58000,190,20001,02/29/2020,0.12,True
+Toyota,30000,,120,9876,04/20/2020,0.2,False
+Ford,20000,21000,0,12345,05/01/2020,0.1,False
+Honda,25000,24000,130,abcde,06/01/2020,0.1,False
+Chevrolet,35000,36000,160,11111,not a date,0.1,False
+Porsche,70000,75000,200,19999,07/04/2021,0.1,False
+"""
+
+# Blank and non-numeric cells, blank zip codes and mixed date formats
+DIRTY_CSV = """Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car
+Porsche,50000,52000,180,1234,01/15/2020,0.1,False
+BMW,40000,35000,,15001,1/5/21,0.15,False
+Porsche,abc,58000,190,1999,2020-03-01,0.12,False
+Toyota,30000,31000,120,,04/20/2020,0.2,False
+Porsche,70000,75000,200,19999,2/29/20,0.1,False
+Ford,20000,21000,100,9876,2021-07-04,0.1,False
+Porsche,NAN,58000,190,1999,2020-03-01,0.12,False
+BMW,40000,-nan,150,15001,1/5/21,0.15,False
+Porsche,55000,56000,170,1500, 03/01/2020 ,0.1,False
+Toyota,30000,32000,120,1234.0,04/20/2020,0.2,False
+Porsche,45000,44000,175,12000,06/30/2020,,False
+"""
+
+# Every used car has the same ratio, so the top 10 depends on tie order
+TIED_CSV = (
+    "Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car\n"
+    + "".join(
+        f"Porsche,{100 * (150 + i % 100)},{100 * (150 + i % 100) + i},{150 + i % 100},{i % 30:02d}001,01/{1 + i % 28:02d}/2020,0.1,False\n"
+        for i in range(300)
+    )
+)
+
+# No zip code between 00 and 19
+NO_MATCH_CSV = """Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car
+Porsche,50000,52000,180,55555,01/15/2020,0.1,False
+"""
+
+
+@pytest.fixture
+def sample_csv(tmp_path) -> str:
+    """
+    Write the sample csv file to a temporary directory
+
+    Args:
+        tmp_path (): Pytest fixture that provides a temporary directory
+
+    Returns:
+        str: The path to the sample csv file
+    """
+    # Write the sample csv file
+    csv_path = tmp_path / "sample.csv"
+    csv_path.write_text(SAMPLE_CSV, encoding="utf-8")
+    # Return the path
+    return str(csv_path)
+
+
+def test_is_small_input(sample_csv: str) -> None:
+    """
+    Test the is_small_input function
+
+    Args:
+        sample_csv (str): Path to the sample csv file
+    """
+    # Check the output
+    assert is_small_input([sample_csv])
+    assert not is_small_input([sample_csv] * 10000)
+
+
+def test_row_quality_mask(sample_csv: str) -> None:
+    """
+    Test the row_quality_mask function
+
+    Args:
+        sample_csv (str): Path to the sample csv file
+    """
+    # Build the mask for every row
+    masks = [row_quality_mask(row) for row in read_rows(sample_csv)]
+    # Check the output
+    assert masks == [0, 0, 0, 4, 1, 8, 16, 0]
+
+
+def test_calculate_price_differences(sample_csv: str) -> None:
+    """
+    Test the calculate_price_differences function
+
+    Args:
+        sample_csv (str): Path to the sample csv file
+    """
+    # Keep only the clean rows
+    rows = [row for row in read_rows(sample_csv) if not row_quality_mask(row)]
+    # Calculate the price differences
+    result = calculate_price_differences(rows)
+    # Check the output
+    assert result["Average Price Change"][0] == pytest.approx(666.67, rel=1e-2)
+    assert result["Median Price Change"][0] == 2000
+    assert result["Average Absolute Price Change"][0] == pytest.approx(4000)
+    assert result["Median Absolute Price Change"][0] == 5000
+
+
+def test_calculate_price_differences_no_match() -> None:
+    """
+    Test that calculate_price_differences returns nan when no zip code is between 00 and 19
+    """
+    # Calculate the price differences
+    result = calculate_price_differences(
+        [{"zipcode": "55555", "Sale Price": "100", "Resell Price": "200"}]
+    )
+    # Check the output
+    assert all(math.isnan(value[0]) for value in result.values())
+
+
+def test_row_quality_mask_matches_pandas() -> None:
+    """
+    Test that row_quality_mask applies the same rules as data_quality.build_quality_mask
+    """
+    # Create test rows
+    data = {
+        "Sale Price": ["100", "abc", "200", "inf", "-Infinity", "300"],
+        "MM/DD/YY Purchase Date": [
+            "01/15/2020",
+            "1/5/21",
+            "2020-03-01",
+            "01/15/2020",
+            "01/15/2020",
+            " 01/15/2020 ",
+        ],
+        "zipcode": ["1234", "15001", "1234.0", "19999", "00501", "12.5"],
+    }
+    rows = [dict(zip(data, values)) for values in zip(*data.values())]
+    # Check the output
+    assert [row_quality_mask(row) for row in rows] == [0, 2, 0, 2, 2, 8]
+    assert build_quality_mask(pd.DataFrame(data)).tolist() == [0, 2, 0, 2, 2, 8]
+
+
+def test_aggregate_depreciation(sample_csv: str) -> None:
+    """
+    Test the aggregate_depreciation function
+
+    Args:
+        sample_csv (str): Path to the sample csv file
+    """
+    # Aggregate the depreciation
+    results = aggregate_depreciation(read_rows(sample_csv))
+    # Check the output
+    assert [result[0] for result in results] == [
+        date(2023, 1, 15),
+        date(2023, 2, 28),
+        date(2024, 7, 4),
+    ]
+    assert results[0][1] == pytest.approx(13550.0)
+
+
+def test_aggregate_depreciation_blank_rate() -> None:
+    """
+    Test that a blank depreciation rate gives a nan value instead of failing
+    """
+    # Aggregate the depreciation
+    results = aggregate_depreciation(
+        [
+            {
+                "Make": "Porsche",
+                "Sale Price": "45000",
+                "Annual Deprecation Rate": "",
+                "MM/DD/YY Purchase Date": "06/30/2020",
+            }
+        ]
+    )
+    # Check the output
+    assert results[0][0] == date(2023, 6, 30)
+    assert math.isnan(results[0][1])
+
+
+def test_add_years() -> None:
+    """
+    Test the add_years function
+    """
+    # Check the output
+    assert add_years(date(2020, 2, 29), 3) == date(2023, 2, 28)
+    assert add_years(date(2020, 2, 29), 4) == date(2024, 2, 29)
+
+
+def test_set_top_10(sample_csv: str) -> None:
+    """
+    Test the set_top_10 function
+
+    Args:
+        sample_csv (str): Path to the sample csv file
+    """
+    # Rank the clean rows
+    rows = [row for row in read_rows(sample_csv) if not row_quality_mask(row)]
+    top_10 = set_top_10(rows)
+    # Check the output
+    assert top_10 == [(70000, 200, 350.0), (50000, 180, 277.778), (40000, 150, 266.667)]
+
+
+@pytest.mark.parametrize("csv_data", [SAMPLE_CSV, DIRTY_CSV, TIED_CSV, NO_MATCH_CSV])
+@pytest.mark.parametrize("report", [avg_med_prices, porsche_sales, top_10_sales_ratio])
+def test_run_report_paths_match(
+    capsys, monkeypatch, tmp_path, report, csv_data: str
+) -> None:
+    """
+    Test that the stdlib path prints the same report and quarantine as the pandas path
+
+    Args:
+        capsys (): Pytest fixture that captures stdout and stderr
+        monkeypatch (): Pytest fixture that changes the working directory
+        tmp_path (): Pytest fixture that provides a temporary directory
+        report (): The report module under test
+        csv_data (str): The csv file contents
+    """
+    # Write the csv file and run both paths from the temporary directory
+    sample_csv = str(tmp_path / "sample.csv")
+    with open(sample_csv, "w", encoding="utf-8") as csv_file:
+        csv_file.write(csv_data)
+    monkeypatch.chdir(tmp_path)
+    report.run_report(sample_csv, light=False)
+    pandas_out = capsys.readouterr().out
+    pandas_quarantine = (tmp_path / "quarantine.csv").read_text(encoding="utf-8")
+    report.run_report(sample_csv, light=True)
+    light_out = capsys.readouterr().out
+    light_quarantine = (tmp_path / "quarantine.csv").read_text(encoding="utf-8")
+    # Check the output
+    assert light_out == pandas_out
+    assert light_quarantine.splitlines()[0] == pandas_quarantine.splitlines()[0]
+    assert len(light_quarantine.splitlines()) == len(pandas_quarantine.splitlines())
+
+
+def test_reports_defer_pandas_import() -> None:
+    """
+    Test that importing the report modules does not import pandas
+    """
+    # Import the modules in a fresh interpreter
+    code = (
+        "import sys, avg_med_prices, porsche_sales, top_10_sales_ratio; "
+        "print('pandas' in sys.modules)"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Check the output
+    assert result.stdout.strip() == "False"
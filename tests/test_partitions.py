@@ -0,0 +1,341 @@
+"""Used Car Sales Technical Assessment Tests"""
+
+import os
+import pandas as pd
+import pytest
+import avg_med_prices
+import porsche_sales
+import top_10_sales_ratio
+from partitions import (
+    filter_by_purchase_month,
+    partition_keys,
+    prune_files,
+    read_partitions,
+    resolve_files,
+    select_files,
+    write_partitions,
+)
+
+# pylint: disable=line-too-long, missing-final-newline, line-too-long, redefined-outer-name
+
+HEADER = "Make,Sale Price,Resell Price,Top Speed,zipcode,MM/DD/YY Purchase Date,Annual Deprecation Rate,is_new_car\n"
+
+# Daily files with rows out of date order, a blank zip code and a blank top speed
+DAILY_CSVS = {
+    "2020-08-01.csv": """Porsche,70000,75000,200,19999,07/04/2021,0.1,False
+Porsche,50000,52000,180,1234,01/15/2020,0.1,False
+BMW,40000,35000,150,15001,01/29/2020,0.15,False
+Toyota,30000,31000,120,,02/20/2020,0.2,False
+Ford,20000,21000,,12345,03/01/2020,0.1,False
+Chevrolet,35000,36000,160,11111,not a date,0.1,False
+""",
+    "2020-08-02.csv": """Porsche,60000,58000,190,20001,02/29/2020,0.12,False
+Honda,25000,24000,130,abcde,03/01/2020,0.1,False
+Porsche,65000,61000,185,45678,04/10/2020,0.1,True
+BMW,45000,47000,155,3000,05/12/2020,0.15,False
+Porsche,55000,50000,170,1500,01/20/2020,0.1,False
+""",
+}
+
+
+@pytest.fixture
+def dataset(tmp_path) -> tuple[str, str]:
+    """
+    Partition the daily files and concatenate them into a single reference file
+
+    Args:
+        tmp_path (): Pytest fixture that provides a temporary directory
+
+    Returns:
+        tuple[str, str]: The partitioned dataset root and the concatenated csv file
+    """
+    root = str(tmp_path / "dataset")
+    # Partition each daily file the way the command line does
+    for name, rows in DAILY_CSVS.items():
+        daily_path = tmp_path / name
+        daily_path.write_text(HEADER + rows, encoding="utf-8")
+        write_partitions(read_partitions([str(daily_path)]), root, part_name=name)
+    # Concatenate the daily files in order
+    concatenated_path = tmp_path / "concatenated.csv"
+    concatenated_path.write_text(
+        HEADER + "".join(DAILY_CSVS.values()), encoding="utf-8"
+    )
+    # Return both paths
+    return root, str(concatenated_path)
+
+
+def _report_output(out: str) -> str:
+    """
+    Drop the data quality summary, whose counts only cover the partitions read
+
+    Args:
+        out (str): The captured stdout
+
+    Returns:
+        str: The report output
+    """
+    return out.split("=" * 60 + "\n", 3)[3]
+
+
+def test_write_partitions(dataset: tuple[str, str]) -> None:
+    """
+    Test the write_partitions function
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # List the written partitions
+    root, _ = dataset
+    partition_dirs = sorted(
+        {os.path.relpath(os.path.dirname(path), root) for path in resolve_files(root)}
+    )
+    # Check the output
+    assert partition_dirs == [
+        os.path.join("purchase_month=2020-01", "zip_prefix=01"),
+        os.path.join("purchase_month=2020-01", "zip_prefix=15"),
+        os.path.join("purchase_month=2020-02", "zip_prefix=20"),
+        os.path.join("purchase_month=2020-02", "zip_prefix=unknown"),
+        os.path.join("purchase_month=2020-03", "zip_prefix=12"),
+        os.path.join("purchase_month=2020-03", "zip_prefix=unknown"),
+        os.path.join("purchase_month=2020-04", "zip_prefix=45"),
+        os.path.join("purchase_month=2020-05", "zip_prefix=03"),
+        os.path.join("purchase_month=2021-07", "zip_prefix=19"),
+        os.path.join("purchase_month=unknown", "zip_prefix=11"),
+    ]
+
+
+def test_write_partitions_does_not_overwrite(
+    tmp_path, dataset: tuple[str, str]
+) -> None:
+    """
+    Test that writing a daily file twice fails instead of replacing its partitions
+
+    Args:
+        tmp_path (): Pytest fixture that provides a temporary directory
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Write the first daily file again
+    root, _ = dataset
+    daily_df = read_partitions([str(tmp_path / "2020-08-01.csv")])
+    # Check the output
+    with pytest.raises(FileExistsError):
+        write_partitions(daily_df, root, part_name="2020-08-01.csv")
+    assert len(read_partitions(resolve_files(root))) == 11
+
+
+def test_write_partitions_keeps_integers(dataset: tuple[str, str]) -> None:
+    """
+    Test that a blank zip code or top speed does not write whole numbers as floats
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Read a partition written from a daily file with blank cells
+    root, _ = dataset
+    partition_path = os.path.join(
+        root, "purchase_month=2020-01", "zip_prefix=01", "2020-08-01.csv"
+    )
+    with open(partition_path, encoding="utf-8") as partition_file:
+        lines = partition_file.read().splitlines()
+    # Check the output
+    assert lines[1] == "Porsche,50000,52000,180,01234,01/15/2020,0.1,False,1"
+
+
+def test_light_path_round_trip(
+    capsys, monkeypatch, tmp_path, dataset: tuple[str, str]
+) -> None:
+    """
+    Test that the stdlib path only quarantines the dirty rows of a partitioned dataset
+
+    Args:
+        capsys (): Pytest fixture that captures stdout and stderr
+        monkeypatch (): Pytest fixture that changes the working directory
+        tmp_path (): Pytest fixture that provides a temporary directory
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Run the report on the stdlib path
+    root, _ = dataset
+    monkeypatch.chdir(tmp_path)
+    avg_med_prices.run_report(root, light=True)
+    out = capsys.readouterr().out
+    # Check the output
+    assert "Clean Rows:                            5" in out
+    assert "Quarantined Rows:                      4" in out
+    assert "Average:            $      -200.00" in out
+
+
+def test_resolve_files(dataset: tuple[str, str]) -> None:
+    """
+    Test the resolve_files function with a file, a directory and a glob
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Resolve each kind of source
+    root, concatenated_path = dataset
+    # Check the output
+    assert resolve_files(concatenated_path) == [concatenated_path]
+    assert len(resolve_files(root)) == 11
+    assert (
+        len(
+            resolve_files(os.path.join(root, "purchase_month=2020-0[12]", "*", "*.csv"))
+        )
+        == 5
+    )
+    with pytest.raises(FileNotFoundError):
+        resolve_files(os.path.join(root, "missing", "*.csv"))
+
+
+def test_read_partitions_restores_daily_order(dataset: tuple[str, str]) -> None:
+    """
+    Test that read_partitions returns the rows in the order of the concatenated daily files
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Read both sources
+    root, concatenated_path = dataset
+    partitioned_df = read_partitions(resolve_files(root))
+    concatenated_df = pd.read_csv(concatenated_path)
+    # Check the output
+    assert list(partitioned_df.columns) == list(concatenated_df.columns)
+    assert (
+        partitioned_df["Sale Price"].tolist() == concatenated_df["Sale Price"].tolist()
+    )
+
+
+def test_select_files_no_match(dataset: tuple[str, str]) -> None:
+    """
+    Test that a window that prunes every partition raises a clear error on both paths
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Select partitions without unknown months
+    root, _ = dataset
+    source = os.path.join(root, "purchase_month=2020-*", "*", "*.csv")
+    # Check the output
+    with pytest.raises(ValueError, match="No partitions"):
+        select_files(source, purchase_months=("2019-01", "2019-12"))
+    for light in (False, True):
+        with pytest.raises(ValueError, match="No partitions"):
+            porsche_sales.run_report(
+                source, light=light, purchase_months=("2019-01", "2019-12")
+            )
+    with pytest.raises(ValueError, match="No csv files"):
+        read_partitions([])
+
+
+def test_partition_keys() -> None:
+    """
+    Test the partition_keys function
+    """
+    # Check the output
+    assert partition_keys(
+        os.path.join("data", "purchase_month=2020-01", "zip_prefix=01", "part-0.csv")
+    ) == {"purchase_month": "2020-01", "zip_prefix": "01"}
+    assert partition_keys("car_sales_dataset.csv") == {}
+
+
+def test_prune_files() -> None:
+    """
+    Test the prune_files function
+    """
+    # Create test paths
+    paths = [
+        os.path.join("purchase_month=2020-01", "zip_prefix=01", "part-0.csv"),
+        os.path.join("purchase_month=2020-02", "zip_prefix=20", "part-0.csv"),
+        os.path.join("purchase_month=2020-03", "zip_prefix=unknown", "part-0.csv"),
+        os.path.join("purchase_month=unknown", "zip_prefix=11", "part-0.csv"),
+        "car_sales_dataset.csv",
+    ]
+    # Check the output
+    assert prune_files(paths, zip_prefixes=("00", "19")) == [
+        paths[0],
+        paths[2],
+        paths[3],
+        paths[4],
+    ]
+    assert prune_files(paths, purchase_months=("2020-02", "2020-03")) == paths[1:]
+    assert prune_files(paths) == paths
+
+
+def test_select_files_prunes_without_opening(dataset: tuple[str, str]) -> None:
+    """
+    Test that pruned partitions are never opened
+
+    Args:
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+    """
+    # Corrupt a partition that the zip prefix filter prunes
+    root, _ = dataset
+    pruned_path = os.path.join(
+        root, "purchase_month=2020-04", "zip_prefix=45", "2020-08-02.csv"
+    )
+    with open(pruned_path, "w", encoding="utf-8") as pruned_file:
+        pruned_file.write('"unterminated')
+    # Read the remaining partitions
+    csv_paths = select_files(root, zip_prefixes=("00", "19"))
+    # Check the output
+    assert pruned_path not in csv_paths
+    assert len(read_partitions(csv_paths)) == 9
+
+
+def test_filter_by_purchase_month() -> None:
+    """
+    Test the filter_by_purchase_month function
+    """
+    # Create a test dataframe
+    test_df = pd.DataFrame(
+        {
+            "MM/DD/YY Purchase Date": [
+                "01/31/2020",
+                "02/01/2020",
+                "03/31/2020",
+                "04/01/2020",
+            ]
+        }
+    )
+    # Filter the dataframe
+    result_df = filter_by_purchase_month(test_df, ("2020-02", "2020-03"))
+    # Check the output
+    assert result_df.index.tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("light", [False, True])
+@pytest.mark.parametrize(
+    "purchase_months", [None, ("2020-01", "2020-02"), ("2020-02", "2020-04")]
+)
+@pytest.mark.parametrize("report", [avg_med_prices, porsche_sales, top_10_sales_ratio])
+def test_run_report_partitioned_matches_concatenated(
+    capsys,
+    monkeypatch,
+    tmp_path,
+    dataset: tuple[str, str],
+    report,
+    purchase_months,
+    light,
+) -> None:
+    """
+    Test that a partitioned dataset gives the same report as the concatenated file
+
+    Args:
+        capsys (): Pytest fixture that captures stdout and stderr
+        monkeypatch (): Pytest fixture that changes the working directory
+        tmp_path (): Pytest fixture that provides a temporary directory
+        dataset (tuple[str, str]): The partitioned dataset root and concatenated csv file
+        report (): The report module under test
+        purchase_months (): The purchase month window
+        light (): Whether to run the stdlib path
+    """
+    # Run the report on both sources
+    root, concatenated_path = dataset
+    monkeypatch.chdir(tmp_path)
+    report.run_report(concatenated_path, light=light, purchase_months=purchase_months)
+    concatenated_out = capsys.readouterr().out
+    report.run_report(root, light=light, purchase_months=purchase_months)
+    partitioned_out = capsys.readouterr().out
+    # Check the output
+    assert _report_output(partitioned_out) == _report_output(concatenated_out)
+    if report is not avg_med_prices and purchase_months is None:
+        assert partitioned_out == concatenated_out
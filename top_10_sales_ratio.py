@@ -1,8 +1,16 @@
 """Used Car Sales Technical Assessment"""
 
-import pandas as pd
+from __future__ import annotations
 
-# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, missing-final-newline, singleton-comparison
+import sys
+from typing import TYPE_CHECKING
+import light_reports
+import partitions
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pylint: disable=line-too-long, trailing-whitespace, trailing-newlines, missing-final-newline, singleton-comparison, import-outside-toplevel
 
 
 # Import csv file with pandas
@@ -11,13 +19,13 @@ def import_csv(csv_path: str) -> pd.DataFrame:
     Import csv file into a pandas dataframe and make it globally available
 
     Args:
-    csv_path (str): The path to the csv file
+    csv_path (str): The path to the csv file, partitioned directory or glob
 
     Returns:
     pd.DataFrame: The dataframe containing the csv data
     """
-    # Return the dataframe
-    return pd.read_csv(csv_path)
+    # Return the dataframe of every csv file the path covers
+    return partitions.read_partitions(partitions.select_files(csv_path))
 
 
 # Ratio = Sales Price / Top Speed
@@ -56,8 +64,8 @@ def set_top_10(df_10: pd.DataFrame) -> pd.DataFrame:
     # Filter the dataframe
     top_10_df = top_10_df[top_10_df["is_new_car"] == False]
 
-    # Sort the dataframe
-    top_10_df = top_10_df.sort_values(by="Ratio", ascending=False)
+    # Sort the dataframe, keeping ties in file order
+    top_10_df = top_10_df.sort_values(by="Ratio", ascending=False, kind="stable")
 
     # Create new dataframe from original dataframe with Sale Price, Top Speed, and Ratio
     ratio_top_10_df = top_10_df[["Sale Price", "Top Speed", "Ratio"]]
@@ -78,17 +86,65 @@ def print_top_10(ratio_top_10_df: pd.DataFrame) -> None:
     # Format the 'Sale Price' column to include the dollar sign without commas
     formatted_df["Sale Price"] = formatted_df["Sale Price"].apply(lambda x: f"${x:.2f}")
 
-    # Print the top 10 cars by price to speed ratio
+    # Print the top 10 cars by price to speed ratio. Top Speed uses the g format so a
+    # column read as float64 because of a blank cell prints 180, not 180.0
     print("\nTop 10 Cars by Price to Speed Ratio:")
     print("=" * 60)
     print(f"{'Sale Price':<15}{'Top Speed':<15}{'Ratio':<15}")
     for _, row in formatted_df.iterrows():
-        print(f"{row['Sale Price']:<15}{row['Top Speed']:<15}{row['Ratio']:<15.3f}")
+        print(f"{row['Sale Price']:<15}{row['Top Speed']:<15g}{row['Ratio']:<15.3f}")
     print("=" * 60)
 
 
-if __name__ == "__main__":
-    df = import_csv("car_sales_dataset.csv")
-    sales_df = sales_ratio(df)
+# Run the top 10 sales ratio report on the clean rows
+def _light_top_10(rows: list[light_reports.Row]) -> None:
+    """
+    Run the top 10 sales ratio report on the stdlib path
+
+    Args:
+        rows (list[light_reports.Row]): The clean rows inside the purchase month window
+    """
+    light_reports.print_top_10(light_reports.set_top_10(rows))
+
+
+# Run the top 10 sales ratio report on the clean dataframe
+def _pandas_top_10(clean_df: pd.DataFrame) -> None:
+    """
+    Run the top 10 sales ratio report on the pandas path
+
+    Args:
+        clean_df (pd.DataFrame): The clean rows inside the purchase month window
+    """
+    sales_df = sales_ratio(clean_df)
     top_10 = set_top_10(sales_df)
     print_top_10(top_10.head(10))
+
+
+# Run the report on the fastest path for the file size
+def run_report(
+    csv_path: str,
+    light: bool | None = None,
+    purchase_months: tuple[str, str] | None = None,
+) -> None:
+    """
+    Run the top 10 sales ratio report, using the stdlib path for small inputs and pandas otherwise.
+    Partitions that cannot match the report filters are skipped without being opened.
+
+    Args:
+        csv_path (str): The path to the csv file, partitioned directory or glob
+        light (bool | None): Force the stdlib path (True) or the pandas path (False).
+            Chosen by the size of the files to read when None.
+        purchase_months (tuple[str, str] | None): The inclusive purchase month window,
+            e.g. ("2020-01", "2020-06"). All months when None.
+    """
+    light_reports.run_report(
+        csv_path, _light_top_10, _pandas_top_10, light, purchase_months
+    )
+
+
+if __name__ == "__main__":
+    # Usage: python top_10_sales_ratio.py [csv file, directory or glob] [first month] [last month]
+    run_report(
+        sys.argv[1] if len(sys.argv) > 1 else "car_sales_dataset.csv",
+        purchase_months=(sys.argv[2], sys.argv[3]) if len(sys.argv) > 3 else None,
+    )